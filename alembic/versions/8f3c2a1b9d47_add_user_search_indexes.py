@@ -0,0 +1,34 @@
+"""add user search indexes
+
+Revision ID: 8f3c2a1b9d47
+Revises: 25d814bc83ed
+Create Date: 2026-10-15 09:12:31.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3c2a1b9d47'
+down_revision: Union[str, None] = '25d814bc83ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+    op.create_index('ix_users_nickname_lower', 'users', [sa.text('lower(nickname)')], unique=False)
+    op.create_index('ix_users_first_name_lower', 'users', [sa.text('lower(first_name)')], unique=False)
+    op.create_index('ix_users_last_name_lower', 'users', [sa.text('lower(last_name)')], unique=False)
+    op.create_index('ix_users_role_locked_created', 'users', ['role', 'is_locked', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_locked_created', table_name='users')
+    op.drop_index('ix_users_last_name_lower', table_name='users')
+    op.drop_index('ix_users_first_name_lower', table_name='users')
+    op.drop_index('ix_users_nickname_lower', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,33 @@
+from typing import Optional
+from redis.asyncio import Redis
+
+class Cache:
+    """Handles the shared Redis client used for caching."""
+    _client: Optional[Redis] = None
+
+    @classmethod
+    def initialize(cls, redis_url: str, connect_timeout: Optional[float] = None, socket_timeout: Optional[float] = None):
+        """
+        Create the shared Redis client; connections are pooled and opened lazily. Callers fall
+        back to the database on Redis errors, so short timeouts keep an unreachable Redis from
+        stalling requests.
+        """
+        if cls._client is None:  # Ensure a single client (and pool) per process
+            cls._client = Redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=connect_timeout,
+                socket_timeout=socket_timeout,
+            )
+
+    @classmethod
+    def get_client(cls) -> Optional[Redis]:
+        """Returns the Redis client, or None when caching has not been initialized."""
+        return cls._client
+
+    @classmethod
+    async def close(cls):
+        """Close the client and release its pooled connections."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
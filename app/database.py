@@ -1,5 +1,6 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
+from typing import Optional
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
@@ -9,13 +10,38 @@ class Database:
     _session_factory = None
 
     @classmethod
-    def initialize(cls, database_url: str, echo: bool = False):
-        """Initialize the async engine and sessionmaker."""
+    def initialize(
+        cls,
+        database_url: str,
+        echo: bool = False,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_recycle: Optional[int] = None,
+        prepared_statement_cache_size: Optional[int] = None,
+    ):
+        """
+        Initialize the async engine (with a pre-pinged connection pool) and sessionmaker.
+        Tuning arguments left as None are not passed, so SQLAlchemy/asyncpg defaults apply;
+        the app passes the values from Settings.
+        """
         if cls._engine is None:  # Ensure engine is created once
-            cls._engine = create_async_engine(database_url, echo=echo, future=True)
-            cls._session_factory = sessionmaker(
-                bind=cls._engine, class_=AsyncSession, expire_on_commit=False, future=True
+            pool_options = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_recycle": pool_recycle,
+            }
+            connect_args = {}
+            if prepared_statement_cache_size is not None and database_url.startswith("postgresql+asyncpg"):
+                # Per-connection cache of server-side prepared statements kept by the asyncpg dialect
+                connect_args["prepared_statement_cache_size"] = prepared_statement_cache_size
+            cls._engine = create_async_engine(
+                database_url,
+                echo=echo,
+                pool_pre_ping=True,
+                connect_args=connect_args,
+                **{name: value for name, value in pool_options.items() if value is not None},
             )
+            cls._session_factory = async_sessionmaker(cls._engine, expire_on_commit=False)
 
     @classmethod
     def get_session_factory(cls):
@@ -1,4 +1,5 @@
 from builtins import Exception, dict, str
+from functools import lru_cache
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,11 +10,14 @@ from app.services.jwt_service import decode_token
 from settings.config import Settings
 from fastapi import Depends
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    """Return application settings."""
+    """Return application settings, loaded once per process."""
     return Settings()
 
+@lru_cache(maxsize=None)
 def get_email_service() -> EmailService:
+    """Return the shared email service; it holds no per-request state."""
     template_manager = TemplateManager()
     return EmailService(template_manager=template_manager)
 
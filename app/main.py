@@ -2,6 +2,7 @@ from builtins import Exception
 from fastapi import FastAPI
 from starlette.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware  # Import the CORSMiddleware
+from app.cache import Cache
 from app.database import Database
 from app.dependencies import get_settings
 from app.routers import user_routes
@@ -31,7 +32,24 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     settings = get_settings()
-    Database.initialize(settings.database_url, settings.debug)
+    Database.initialize(
+        settings.database_url,
+        settings.debug,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        prepared_statement_cache_size=settings.db_prepared_statement_cache_size,
+    )
+    if settings.redis_url:  # An empty URL runs without the Redis cache
+        Cache.initialize(
+            settings.redis_url,
+            connect_timeout=settings.redis_connect_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+        )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await Cache.close()
 
 @app.exception_handler(Exception)
 async def exception_handler(request, exc):
@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum
 import uuid
 from sqlalchemy import (
-    Column, String, Integer, DateTime, Boolean, func, Enum as SQLAlchemyEnum
+    Column, String, Integer, DateTime, Boolean, Index, func, Enum as SQLAlchemyEnum
 )
 from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import Mapped, mapped_column
@@ -74,6 +74,15 @@ class User(Base):
     email_verified: Mapped[bool] = Column(Boolean, default=False, nullable=False)
     hashed_password: Mapped[str] = Column(String(255), nullable=False)
 
+    # Functional indexes back the case-insensitive filters used by user search,
+    # and the composite one backs the combined role/status/registration date filter.
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email)),
+        Index("ix_users_nickname_lower", func.lower(nickname)),
+        Index("ix_users_first_name_lower", func.lower(first_name)),
+        Index("ix_users_last_name_lower", func.lower(last_name)),
+        Index("ix_users_role_locked_created", role, is_locked, created_at),
+    )
 
     def __repr__(self) -> str:
         """Provides a readable representation of a user object."""
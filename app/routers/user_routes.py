@@ -27,7 +27,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.schemas.user_schemas import UserUpdate, UserResponse
 from app.dependencies import get_db, oauth2_scheme, require_role
-from typing import Optional
+from typing import List, Optional, Tuple
 from fastapi import Query
 from datetime import datetime
 from app.schemas.user_schemas import UserListResponse
@@ -35,14 +35,36 @@ from app.dependencies import get_current_user, get_db, get_email_service, requir
 from app.schemas.pagination_schema import EnhancedPagination
 from app.schemas.token_schema import TokenResponse
 from app.schemas.user_schemas import LoginRequest, UserBase, UserCreate, UserListResponse, UserResponse, UserUpdate
-from app.services.user_service import UserService
+from app.services.user_service import UserConflictError, UserService
 from app.services.jwt_service import create_access_token
-from app.utils.link_generation import create_user_links, generate_pagination_links
+from app.utils.link_generation import create_user_links, generate_keyset_pagination_links, generate_pagination_links
 from app.dependencies import get_settings
 from app.services.email_service import EmailService
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 settings = get_settings()
+
+def _keyset_cursor(after_created_at: Optional[datetime], after_id: Optional[UUID]) -> Optional[Tuple[datetime, UUID]]:
+    """Combine the keyset pagination query parameters, which are only meaningful together."""
+    if (after_created_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_created_at and after_id must be provided together"
+        )
+    return (after_created_at, after_id) if after_created_at is not None else None
+
+def _next_keyset_cursor(items: List[UserResponse], limit: int) -> dict:
+    """Cursor for the page after `items`, or empty values when this was the last page."""
+    if items and len(items) == limit:
+        return {"next_after_created_at": items[-1].created_at, "next_after_id": items[-1].id}
+    return {"next_after_created_at": None, "next_after_id": None}
+
+def _pagination_links(request: Request, after: Optional[Tuple[datetime, UUID]], cursor: dict, skip: int, limit: int, total: int):
+    """Offset links for offset pages; cursor links once the client pages by keyset."""
+    if after:
+        return generate_keyset_pagination_links(request, cursor["next_after_created_at"], cursor["next_after_id"])
+    return generate_pagination_links(request, skip, limit, total)
+
 @router.get("/users/{user_id}", response_model=UserResponse, name="get_user", tags=["User Management Requires (Admin or Manager Roles)"])
 async def get_user(user_id: UUID, request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
     """
@@ -94,14 +116,10 @@ async def update_user(user_id: UUID, user_update: UserUpdate, request: Request,
     - **user_update**: UserUpdate model with updated user information.
     """
     user_data = user_update.model_dump(exclude_unset=True)
-    existing_user = await UserService.get_by_email(db, user_update.email)
-    if existing_user:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists")
-
-    existing_user_nickname = await UserService.get_by_nickname(db, user_update.nickname)
-    if existing_user_nickname:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Nickname already exists")
-    updated_user = await UserService.update(db, user_id, user_data)
+    try:
+        updated_user = await UserService.update(db, user_id, user_data)
+    except UserConflictError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{e.field.capitalize()} already exists")
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -143,7 +161,7 @@ async def create_user(user: UserCreate, request: Request, db: AsyncSession = Dep
     Create a new user.
 
     This endpoint creates a new user with the provided information. If the email
-    already exists, it returns a 400 error. On successful creation, it returns the
+    or nickname already exists, it returns a 400 error. On successful creation, it returns the
     newly created user's information along with links to related actions.
 
     Parameters:
@@ -154,11 +172,10 @@ async def create_user(user: UserCreate, request: Request, db: AsyncSession = Dep
     Returns:
     - UserResponse: The newly created user's information along with navigation links.
     """
-    existing_user = await UserService.get_by_email(db, user.email)
-    if existing_user:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists")
-    
-    created_user = await UserService.create(db, user.model_dump(), email_service)
+    try:
+        created_user = await UserService.create(db, user.model_dump(), email_service)
+    except UserConflictError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{e.field.capitalize()} already exists")
     if not created_user:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create user")
     
@@ -184,31 +201,54 @@ async def list_users(
     request: Request,
     skip: int = 0,
     limit: int = 10,
+    after_created_at: Optional[datetime] = Query(None, description="Creation date of the last user on the previous page"),
+    after_id: Optional[UUID] = Query(None, description="ID of the last user on the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))
 ):
+    after = _keyset_cursor(after_created_at, after_id)
     total_users = await UserService.count(db)
-    users = await UserService.list_users(db, skip, limit)
+    users = await UserService.list_users(db, skip, limit, after)
 
+    # Rows come from the database, so skip re-validating them field by field
     user_responses = [
-        UserResponse.model_validate(user) for user in users
+        UserResponse.model_construct(
+            id=user.id,
+            nickname=user.nickname,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            bio=user.bio,
+            profile_picture_url=user.profile_picture_url,
+            github_profile_url=user.github_profile_url,
+            linkedin_profile_url=user.linkedin_profile_url,
+            role=user.role,
+            email=user.email,
+            is_professional=user.is_professional,
+            created_at=user.created_at
+        )
+        for user in users
     ]
     
-    pagination_links = generate_pagination_links(request, skip, limit, total_users)
+    cursor = _next_keyset_cursor(user_responses, limit)
+    pagination_links = _pagination_links(request, after, cursor, skip, limit, total_users)
     
-    # Construct the final response with pagination details
+    # Construct the final response with pagination details; page numbers only apply to offset paging
     return UserListResponse(
         items=user_responses,
         total=total_users,
-        page=skip // limit + 1,
+        page=None if after else skip // limit + 1,
         size=len(user_responses),
-        links=pagination_links  # Ensure you have appropriate logic to create these links
+        links=pagination_links,  # Ensure you have appropriate logic to create these links
+        **cursor
     )
 
 
 @router.post("/register/", response_model=UserResponse, tags=["Login and Registration"])
 async def register(user_data: UserCreate, session: AsyncSession = Depends(get_db), email_service: EmailService = Depends(get_email_service)):
-    user = await UserService.register_user(session, user_data.model_dump(), email_service)
+    try:
+        user = await UserService.register_user(session, user_data.model_dump(), email_service)
+    except UserConflictError as e:
+        raise HTTPException(status_code=400, detail=f"{e.field.capitalize()} already exists")
     if user:
         return user
     raise HTTPException(status_code=400, detail="Email already exists")
@@ -273,14 +313,19 @@ async def search_users(
     registration_date_to: Optional[datetime] = Query(None, description="Filter users registered before this date"),
     skip: int = Query(0, description="Number of records to offset"),
     limit: int = Query(10, description="Maximum number of results to retrieve"),
+    after_created_at: Optional[datetime] = Query(None, description="Creation date of the last user on the previous page"),
+    after_id: Optional[UUID] = Query(None, description="ID of the last user on the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Search for users based on a variety of filter criteria, such as username, email, 
     name, role, account status, or registration date range.
     
-    Results include pagination details and navigational links.
+    Results include pagination details and navigational links. To fetch the next page without an
+    offset, pass the response's `next_after_created_at` and `next_after_id` back as
+    `after_created_at` and `after_id`.
     """
+    after = _keyset_cursor(after_created_at, after_id)
     total_users = await UserService.count(db)
 
     # Retrieve users based on provided search filters
@@ -295,7 +340,8 @@ async def search_users(
         registration_date_from=registration_date_from, 
         registration_date_to=registration_date_to, 
         skip=skip, 
-        limit=limit
+        limit=limit,
+        after=after
     )
 
     # If no users are found, return a 404 error
@@ -305,19 +351,18 @@ async def search_users(
             detail="No matching users found for the provided criteria."
         )
 
-    # Map database results to API response schema
-    user_responses = [
-        UserResponse.model_validate(user) for user in users
-    ]
-
     # Generate pagination metadata and links
-    pagination_links = generate_pagination_links(request, skip, limit, total_users)
+    cursor = _next_keyset_cursor(users, limit)
+    pagination_links = _pagination_links(request, after, cursor, skip, limit, total_users)
 
-    # Construct response object
-    return UserListResponse(
-        items=user_responses,
+    # The service already returns UserResponse objects built from database rows, so skip
+    # FastAPI's response_model re-validation and serialize the page in one pydantic-core pass
+    response = UserListResponse.model_construct(
+        items=users,
         total=total_users,
-        page=(skip // limit) + 1,
-        size=len(user_responses),
-        links=pagination_links
+        page=None if after else (skip // limit) + 1,
+        size=len(users),
+        links=pagination_links,
+        **cursor
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
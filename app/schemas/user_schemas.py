@@ -6,6 +6,7 @@ from enum import Enum
 import uuid
 import re
 from app.models.user_model import UserRole
+from app.schemas.pagination_schema import PaginationLink
 from app.utils.nickname_gen import generate_nickname
 
 
@@ -79,6 +80,7 @@ class UserResponse(UserBase):
     nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example=generate_nickname())    
     is_professional: Optional[bool] = Field(default=False, example=True)
     role: UserRole
+    created_at: Optional[datetime] = Field(None, description="When the user registered")
 
 class LoginRequest(BaseModel):
     email: str = Field(..., example="john.doe@example.com")
@@ -98,5 +100,8 @@ class UserListResponse(BaseModel):
         "github_profile_url": "https://github.com/johndoe"
     }])
     total: int = Field(..., example=100)
-    page: int = Field(..., example=1)
+    page: Optional[int] = Field(None, example=1, description="Page number; not set when paging with after_created_at/after_id")
     size: int = Field(..., example=10)
+    next_after_created_at: Optional[datetime] = Field(None, description="Pass as after_created_at to fetch the next page")
+    next_after_id: Optional[uuid.UUID] = Field(None, description="Pass as after_id to fetch the next page")
+    links: List[PaginationLink] = Field([], description="Navigation links; keyset pages only link to the next cursor")
@@ -1,11 +1,18 @@
 from builtins import Exception, bool, classmethod, int, str
+import asyncio
 from datetime import datetime, timezone
+import hashlib
+import json
 import secrets
-from typing import Optional, Dict, List
-from pydantic import ValidationError
-from sqlalchemy import func, null, update, select
+from typing import Optional, Dict, List, Tuple
+from enum import Enum
+from pydantic import TypeAdapter, ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, delete as sa_delete, func, inspect, null, or_, tuple_, update, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.cache import Cache
 from app.dependencies import get_email_service, get_settings
 from app.models.user_model import User
 from app.schemas.user_schemas import UserCreate, UserResponse, UserUpdate
@@ -19,98 +26,380 @@ import logging
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Settings read on hot paths, bound once since they never change while the process runs
+_MAX_LOGIN_ATTEMPTS: int = settings.max_login_attempts
+_FAILED_LOGIN_WINDOW: int = settings.failed_login_window
+_USER_CACHE_TTL: int = settings.user_cache_ttl
+_USER_COUNT_CACHE_TTL: int = settings.user_count_cache_ttl
+
+# Validate the raw create/update dicts against the request schemas; the input is untrusted,
+# so unlike rows read back from the database it is always fully validated
+_CREATE_ADAPTER = TypeAdapter(UserCreate)
+_UPDATE_ADAPTER = TypeAdapter(UserUpdate)
+
+# Columns written to the cache payload. The email verification token is a bearer secret that
+# is only needed by verify_email_with_token, which reads it from the database, so it is left out.
+_USER_COLUMNS = tuple(attr.key for attr in User.__mapper__.column_attrs if attr.key != "verification_token")
+_USER_DATETIME_FIELDS = frozenset(("professional_status_updated_at", "last_login_at", "created_at", "updated_at"))
+
+# Cache key templates for the single-column user lookups, keyed by filter name. The version is
+# derived from the cached columns, so a deploy that changes them stops reading older payloads.
+_USER_CACHE_VERSION = hashlib.sha1(",".join(_USER_COLUMNS).encode()).hexdigest()[:8]
+_USER_CACHE_KEYS = {
+    "id": f"user:{_USER_CACHE_VERSION}:id:{{}}",
+    "email": f"user:{_USER_CACHE_VERSION}:email:{{}}",
+    "nickname": f"user:{_USER_CACHE_VERSION}:nick:{{}}",
+}
+_FAILED_LOGIN_KEY = "user:fail:{}"
+_USER_COUNT_KEY = "stats:users:count"
+_USER_COUNT_LOCK_KEY = "stats:users:count:lock"
+
+# Single-column user lookups, built once with bound parameters so every call shares one
+# compiled statement (and, on asyncpg, one server-side prepared statement per lookup)
+_USER_LOOKUPS = {
+    "id": select(User).where(User.id == bindparam("id")),
+    "email": select(User).where(User.email == bindparam("email")),
+    "nickname": select(User).where(User.nickname == bindparam("nickname")),
+}
+
+# search_users filters, applied in a fixed order with values passed as bound parameters so
+# each filter combination compiles to one statement shape that SQLAlchemy can cache
+_SEARCH_FILTERS = {
+    "username": lambda query, value: query.filter(func.lower(User.nickname) == value.lower()),
+    "email": lambda query, value: query.filter(func.lower(User.email) == value.lower()),
+    "first_name": lambda query, value: query.filter(func.lower(User.first_name) == value.lower()),
+    "last_name": lambda query, value: query.filter(func.lower(User.last_name) == value.lower()),
+    "role": lambda query, value: query.filter(User.role == value),
+    "account_status": lambda query, value: query.filter(User.is_locked == (value.lower() == "locked")),
+    "registration_date_from": lambda query, value: query.filter(User.created_at >= value),
+    "registration_date_to": lambda query, value: query.filter(User.created_at <= value),
+}
+
+
+def _json_default(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _serialize_user(user: User) -> str:
+    """
+    Dump the column values of a loaded user into a JSON cache payload.
+
+    The payload includes the bcrypt hash that login needs, so the Redis instance has to be treated
+    like the database: private network only and never exposed outside the deployment.
+    """
+    data = {key: getattr(user, key) for key in _USER_COLUMNS}
+    return json.dumps(data, default=_json_default)
+
+
+def _deserialize_user(payload: str) -> User:
+    """
+    Rebuild a (transient) user from a JSON cache payload.
+
+    Raises ValueError if the payload is not valid or does not hold exactly the cached columns.
+    """
+    data = json.loads(payload)
+    if not isinstance(data, dict) or data.keys() != set(_USER_COLUMNS):
+        raise ValueError("Cached user payload does not match the cached columns")
+    data["id"] = UUID(data["id"])
+    data["role"] = UserRole(data["role"])
+    for key in _USER_DATETIME_FIELDS:
+        if data.get(key) is not None:
+            data[key] = datetime.fromisoformat(data[key])
+    return User(**data)
+
+
+class UserConflictError(ValueError):
+    """Raised when an email or nickname already belongs to another user."""
+
+    def __init__(self, field: str):
+        super().__init__(f"User with given {field} already exists.")
+        self.field = field
+
+
 class UserService:
     @classmethod
-    async def _execute_query(cls, session: AsyncSession, query):
+    async def _execute_read(cls, session: AsyncSession, query, params: Optional[Dict[str, object]] = None):
+        """Run a read-only query without ending the session's transaction."""
         try:
-            result = await session.execute(query)
-            await session.commit()
-            return result
+            return await session.execute(query, params)
         except SQLAlchemyError as e:
             logger.error(f"Database error: {e}")
             await session.rollback()
             return None
 
     @classmethod
-    async def _fetch_user(cls, session: AsyncSession, **filters) -> Optional[User]:
-        query = select(User).filter_by(**filters)
-        result = await cls._execute_query(session, query)
-        return result.scalars().first() if result else None
+    def _user_cache_keys(cls, user_id: Optional[UUID] = None, email: Optional[str] = None, nickname: Optional[str] = None) -> List[str]:
+        keys = []
+        if user_id is not None:
+            keys.append(_USER_CACHE_KEYS["id"].format(user_id))
+        if email is not None:
+            keys.append(_USER_CACHE_KEYS["email"].format(email.lower()))
+        if nickname is not None:
+            keys.append(_USER_CACHE_KEYS["nickname"].format(nickname.lower()))
+        return keys
+
+    @classmethod
+    async def _get_cached_user(cls, session: AsyncSession, key: str, field: str, value) -> Optional[User]:
+        """
+        Look a user up in Redis and attach it to the session without querying the database.
+        Returns None on a miss, on a Redis error, or when caching is disabled.
+        """
+        client = Cache.get_client()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(key)
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+            return None
+        if payload is None:
+            return None
+
+        try:
+            user = _deserialize_user(payload)
+        except (ValueError, TypeError, KeyError) as e:
+            # A corrupt or outdated entry is just a miss; drop it so the next lookup refills it
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            try:
+                await client.delete(key)
+            except RedisError as redis_error:
+                logger.warning(f"Cache error: {redis_error}")
+            return None
+        # Keys are case-insensitive but the database lookups are not
+        if str(getattr(user, field)) != str(value):
+            return None
+
+        make_transient_to_detached(user)
+        existing = session.sync_session.identity_map.get(inspect(user).key)
+        if existing is not None:
+            return existing
+        return await session.merge(user, load=False)
+
+    @classmethod
+    async def _cache_user(cls, user: User):
+        client = Cache.get_client()
+        if client is None:
+            return
+        payload = _serialize_user(user)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in cls._user_cache_keys(user.id, user.email, user.nickname):
+                    pipe.set(key, payload, ex=_USER_CACHE_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+
+    @classmethod
+    async def _invalidate_user_cache(cls, user_id: UUID, email: Optional[str] = None, nickname: Optional[str] = None):
+        """
+        Drop every cached lookup for a user. The email/nickname keys of the previously cached
+        version are removed as well, so renaming a user does not leave stale entries behind.
+        """
+        client = Cache.get_client()
+        if client is None:
+            return
+        keys = cls._user_cache_keys(user_id, email, nickname)
+        try:
+            payload = await client.get(keys[0])
+            if payload is not None:
+                try:
+                    cached = json.loads(payload)
+                    keys += cls._user_cache_keys(email=cached["email"], nickname=cached["nickname"])
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
+                    # Unreadable entry: the id key still goes, the rest expire with their TTL
+                    logger.warning(f"Discarding unreadable cache entry {keys[0]}: {e}")
+            await client.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+
+    @classmethod
+    async def _record_failed_login(cls, user_id: UUID) -> Optional[int]:
+        """
+        Atomically count a failed login in Redis. Returns the number of failures in the
+        current window, or None when Redis is unavailable.
+        """
+        client = Cache.get_client()
+        if client is None:
+            return None
+        key = _FAILED_LOGIN_KEY.format(user_id)
+        try:
+            # One MULTI/EXEC so the counter can never be left without a TTL; NX keeps the
+            # window anchored at the first failure instead of extending it on every attempt
+            async with client.pipeline(transaction=True) as pipe:
+                attempts, _ = await pipe.incr(key).expire(key, _FAILED_LOGIN_WINDOW, nx=True).execute()
+            return attempts
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+            return None
+
+    @classmethod
+    async def _clear_failed_logins(cls, user_id: UUID):
+        client = Cache.get_client()
+        if client is None:
+            return
+        try:
+            await client.delete(_FAILED_LOGIN_KEY.format(user_id))
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+
+    @classmethod
+    async def _invalidate_user_count(cls):
+        client = Cache.get_client()
+        if client is None:
+            return
+        try:
+            await client.delete(_USER_COUNT_KEY)
+        except RedisError as e:
+            logger.warning(f"Cache error: {e}")
+
+    @classmethod
+    async def _fetch_user(cls, session: AsyncSession, field: str, value) -> Optional[User]:
+        cache_key = _USER_CACHE_KEYS[field].format(str(value).lower()) if value is not None else None
+        if cache_key:
+            user = await cls._get_cached_user(session, cache_key, field, value)
+            if user:
+                return user
+
+        result = await cls._execute_read(session, _USER_LOOKUPS[field], {field: value})
+        user = result.scalars().first() if result else None
+        if user and cache_key:
+            await cls._cache_user(user)
+        return user
 
     @classmethod
     async def get_by_id(cls, session: AsyncSession, user_id: UUID) -> Optional[User]:
-        return await cls._fetch_user(session, id=user_id)
+        return await cls._fetch_user(session, "id", user_id)
 
     @classmethod
     async def get_by_nickname(cls, session: AsyncSession, nickname: str) -> Optional[User]:
-        return await cls._fetch_user(session, nickname=nickname)
+        return await cls._fetch_user(session, "nickname", nickname)
 
     @classmethod
     async def get_by_email(cls, session: AsyncSession, email: str) -> Optional[User]:
-        return await cls._fetch_user(session, email=email)
+        return await cls._fetch_user(session, "email", email)
+
+    @classmethod
+    async def find_conflicts(cls, session: AsyncSession, email: Optional[str] = None, nickname: Optional[str] = None, exclude_id: Optional[UUID] = None) -> Tuple[bool, bool]:
+        """
+        Check in a single query whether an email and/or nickname is already taken.
+
+        :param session: The AsyncSession instance for database access.
+        :param email: Email to check, skipped when None.
+        :param nickname: Nickname to check, skipped when None.
+        :param exclude_id: Ignore the user with this ID (e.g. the user being updated).
+        :return: Tuple of (email_taken, nickname_taken).
+        """
+        conditions = []
+        if email is not None:
+            conditions.append(User.email == email)
+        if nickname is not None:
+            conditions.append(User.nickname == nickname)
+        if not conditions:
+            return False, False
+
+        query = select(User.email, User.nickname).where(or_(*conditions))
+        if exclude_id is not None:
+            query = query.where(User.id != exclude_id)
+        result = await cls._execute_read(session, query)
+        rows = result.all() if result else []
+        email_taken = email is not None and any(row.email == email for row in rows)
+        nickname_taken = nickname is not None and any(row.nickname == nickname for row in rows)
+        return email_taken, nickname_taken
 
     @classmethod
     async def create(cls, session: AsyncSession, user_data: Dict[str, str], email_service: EmailService) -> Optional[User]:
+        """
+        Validate and store a new user.
+
+        :return: The created user, or None if the data is invalid.
+        :raises UserConflictError: If the email or nickname already belongs to another user.
+        """
         try:
-            validated_data = UserCreate(**user_data).model_dump()
-            
-            # Check for duplicate email
-            if await cls.get_by_email(session, validated_data['email']):
-                raise ValueError("User with given email already exists.")
+            validated_data = _CREATE_ADAPTER.validate_python(user_data).model_dump()
             
-            # Check for duplicate nickname
-            if await cls.get_by_nickname(session, validated_data['nickname']):
-                raise ValueError("User with given nickname already exists.")
+            # Check for duplicate email and nickname in one round-trip
+            email_taken, nickname_taken = await cls.find_conflicts(
+                session, email=validated_data['email'], nickname=validated_data['nickname']
+            )
+            if email_taken:
+                raise UserConflictError("email")
+            if nickname_taken:
+                raise UserConflictError("nickname")
 
-            validated_data['hashed_password'] = hash_password(validated_data.pop('password'))
+            validated_data['hashed_password'] = await asyncio.to_thread(hash_password, validated_data.pop('password'))
             new_user = User(**validated_data)
 
             session.add(new_user)
             await session.commit()
+            await cls._invalidate_user_count()
             return new_user
         except ValidationError as e:
             logger.error(f"Validation error: {e}")
             return None
+        except UserConflictError as e:
+            logger.error(e)
+            raise
         except ValueError as e:
             logger.error(e)
             return None
 
     @classmethod
     async def update(cls, session: AsyncSession, user_id: UUID, update_data: Dict[str, str]) -> Optional[User]:
+        """
+        Validate and apply an update to a user.
+
+        :return: The updated user, or None if the data is invalid or the user does not exist.
+        :raises UserConflictError: If the new email or nickname belongs to another user.
+        """
         try:
-            validated_data = UserUpdate(**update_data).model_dump(exclude_unset=True)
+            validated_data = _UPDATE_ADAPTER.validate_python(update_data).model_dump(exclude_unset=True)
 
-            if 'email' in validated_data:
-                existing_user = await cls.get_by_email(session, validated_data['email'])
-                if existing_user and existing_user.id != user_id:
-                    logger.error("User with given email already exists.")
-                    return None
+            email_taken, nickname_taken = await cls.find_conflicts(
+                session,
+                email=validated_data.get('email'),
+                nickname=validated_data.get('nickname'),
+                exclude_id=user_id
+            )
+            if email_taken:
+                raise UserConflictError("email")
+            if nickname_taken:
+                raise UserConflictError("nickname")
 
-            if 'nickname' in validated_data:
-                existing_user_nickname = await cls.get_by_nickname(session, validated_data['nickname'])
-                if existing_user_nickname and existing_user_nickname.id != user_id:
-                    logger.error("User with given nickname already exists.")
-                    return None
-                
             if 'password' in validated_data:
-                validated_data['hashed_password'] = hash_password(validated_data.pop('password'))
+                validated_data['hashed_password'] = await asyncio.to_thread(hash_password, validated_data.pop('password'))
 
+            # RETURNING hands back the updated row, so no follow-up SELECT is needed
             query = (
                 update(User)
                 .where(User.id == user_id)
                 .values(**validated_data)
-                .execution_options(synchronize_session="fetch")
+                .returning(User)
+                .execution_options(populate_existing=True)
             )
-            await cls._execute_query(session, query)
+            result = await session.execute(query)
+            updated_user = result.scalar_one_or_none()
+            await session.commit()
+            await cls._invalidate_user_cache(user_id, validated_data.get('email'), validated_data.get('nickname'))
 
-            updated_user = await cls.get_by_id(session, user_id)
             if updated_user:
-                session.refresh(updated_user)
                 logger.info(f"User {user_id} updated successfully.")
                 return updated_user
 
             logger.error(f"User {user_id} not found after update attempt.")
             return None
+        except UserConflictError as e:
+            logger.error(e)
+            raise
+        except SQLAlchemyError as e:
+            logger.error(f"Database error: {e}")
+            await session.rollback()
+            return None
         except Exception as e:
             logger.error(f"Error during user update: {e}")
             return None
@@ -128,7 +417,8 @@ class UserService:
         registration_date_from: Optional[datetime] = None,
         registration_date_to: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[UserResponse]:
         """
         Searches for users in the database based on provided filters. Supports filtering by username, email, 
@@ -143,68 +433,95 @@ class UserService:
         :param account_status: "active" or "locked" to filter by account status.
         :param registration_date_from: Start date for registration date range filter.
         :param registration_date_to: End date for registration date range filter.
-        :param skip: Number of records to skip for pagination.
+        :param skip: Number of records to skip for pagination (ignored when `after` is given).
         :param limit: Maximum number of records to return for pagination.
-        :return: List of UserResponse objects matching the filters.
+        :param after: (created_at, id) of the last user on the previous page, for keyset pagination.
+        :return: List of UserResponse objects matching the filters, newest first.
+
+        Note: responses are built with ``UserResponse.model_construct``, which is only safe
+        because every row originated in the database. Never use it for user-supplied data.
         """
-        query = select(User)
-
-        # Create filters dynamically
-        if username:
-            query = query.filter(func.lower(User.nickname) == func.lower(username))
-        if email:
-            query = query.filter(func.lower(User.email) == func.lower(email))
-        if first_name:
-            query = query.filter(func.lower(User.first_name) == func.lower(first_name))
-        if last_name:
-            query = query.filter(func.lower(User.last_name) == func.lower(last_name))
-        if role:
-            query = query.filter(User.role == role)
-        if account_status:
-            is_locked = account_status.lower() == "locked"
-            query = query.filter(User.is_locked == is_locked)
-        if registration_date_from:
-            query = query.filter(User.created_at >= registration_date_from)
-        if registration_date_to:
-            query = query.filter(User.created_at <= registration_date_to)
+        # Select only the columns the response needs; rows skip ORM hydration entirely
+        query = select(
+            User.id, User.email, User.nickname, User.is_professional, User.role, User.created_at, User.is_locked
+        )
+
+        # Apply the filters that were provided
+        criteria = {
+            "username": username,
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "role": role,
+            "account_status": account_status,
+            "registration_date_from": registration_date_from,
+            "registration_date_to": registration_date_to,
+        }
+        for name, apply_filter in _SEARCH_FILTERS.items():
+            value = criteria[name]
+            if value:
+                query = apply_filter(query, value)
 
         # Apply pagination
-        query = query.offset(skip).limit(limit)
+        query = cls._paginate(query, skip, limit, after)
 
         # Execute the query
-        result = await cls._execute_query(session, query)
-        users = result.scalars().all() if result else []
+        result = await cls._execute_read(session, query)
+        rows = result.all() if result else []
 
-        # Map to response schema
+        # Map to response schema. The rows come straight from the database, so the
+        # values were already validated on write and model_construct can skip validation.
         user_responses = [
-            UserResponse(
-                id=user.id,
-                email=user.email,
-                nickname=user.nickname,
-                is_professional=user.is_professional,
-                role=user.role,
-                registration_date=user.created_at,
-                account_status="Active" if not user.is_locked else "Locked"
+            UserResponse.model_construct(
+                id=row.id,
+                email=row.email,
+                nickname=row.nickname,
+                is_professional=row.is_professional,
+                role=row.role,
+                created_at=row.created_at,
+                account_status="Active" if not row.is_locked else "Locked"
             )
-            for user in users
+            for row in rows
         ]
 
         return user_responses
 
     @classmethod
     async def delete(cls, session: AsyncSession, user_id: UUID) -> bool:
-        user = await cls.get_by_id(session, user_id)
-        if not user:
+        query = sa_delete(User).where(User.id == user_id).returning(User.id, User.email, User.nickname)
+        try:
+            result = await session.execute(query)
+            deleted = result.first()
+            await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Database error: {e}")
+            await session.rollback()
+            return False
+        if not deleted:
             logger.info(f"User with ID {user_id} not found.")
             return False
-        await session.delete(user)
-        await session.commit()
+        await cls._invalidate_user_cache(deleted.id, deleted.email, deleted.nickname)
+        await cls._invalidate_user_count()
         return True
 
     @classmethod
-    async def list_users(cls, session: AsyncSession, skip: int = 0, limit: int = 10) -> List[User]:
-        query = select(User).offset(skip).limit(limit)
-        result = await cls._execute_query(session, query)
+    def _paginate(cls, query, skip: int, limit: int, after: Optional[Tuple[datetime, UUID]]):
+        """
+        Order users newest first and page through them. With `after` the page starts right
+        behind that (created_at, id) key, so deep pages cost the same as the first one;
+        `skip` is kept as an OFFSET fallback for existing callers.
+        """
+        query = query.order_by(User.created_at.desc(), User.id.desc())
+        if after is not None:
+            query = query.where(tuple_(User.created_at, User.id) < tuple_(*after))
+        else:
+            query = query.offset(skip)
+        return query.limit(limit)
+
+    @classmethod
+    async def list_users(cls, session: AsyncSession, skip: int = 0, limit: int = 10, after: Optional[Tuple[datetime, UUID]] = None) -> List[User]:
+        query = cls._paginate(select(User), skip, limit, after)
+        result = await cls._execute_read(session, query)
         return result.scalars().all() if result else []
 
     @classmethod
@@ -220,29 +537,42 @@ class UserService:
                 return None
             if user.is_locked:
                 return None
-            if verify_password(password, user.hashed_password):
+            # bcrypt is deliberately slow; run it in a worker thread so the event loop stays free
+            if await asyncio.to_thread(verify_password, password, user.hashed_password):
                 user.failed_login_attempts = 0
                 user.last_login_at = datetime.now(timezone.utc)
                 session.add(user)
                 await session.commit()
+                await cls._invalidate_user_cache(user.id, user.email, user.nickname)
+                await cls._clear_failed_logins(user.id)
                 return user
             else:
-                user.failed_login_attempts += 1
-                if user.failed_login_attempts >= settings.max_login_attempts:
+                failed_attempts = await cls._record_failed_login(user.id)
+                if failed_attempts is None:
+                    # Redis unavailable, count the attempt on the row instead
+                    failed_attempts = user.failed_login_attempts + 1
+                elif failed_attempts < _MAX_LOGIN_ATTEMPTS:
+                    # Below the threshold the counter lives in Redis only
+                    return None
+                user.failed_login_attempts = failed_attempts
+                if user.failed_login_attempts >= _MAX_LOGIN_ATTEMPTS:
                     user.is_locked = True
                 session.add(user)
                 await session.commit()
+                await cls._invalidate_user_cache(user.id, user.email, user.nickname)
         return None
 
     @classmethod
     async def is_account_locked(cls, session: AsyncSession, email: str) -> bool:
-        user = await cls.get_by_email(session, email)
-        return user.is_locked if user else False
+        # Only the flag is needed, so skip loading the whole user
+        query = select(User.is_locked).where(User.email == email)
+        result = await cls._execute_read(session, query)
+        return bool(result.scalar()) if result else False
 
 
     @classmethod
     async def reset_password(cls, session: AsyncSession, user_id: UUID, new_password: str) -> bool:
-        hashed_password = hash_password(new_password)
+        hashed_password = await asyncio.to_thread(hash_password, new_password)
         user = await cls.get_by_id(session, user_id)
         if user:
             user.hashed_password = hashed_password
@@ -250,12 +580,16 @@ class UserService:
             user.is_locked = False  # Unlocking the user account, if locked
             session.add(user)
             await session.commit()
+            await cls._invalidate_user_cache(user.id, user.email, user.nickname)
+            await cls._clear_failed_logins(user.id)
             return True
         return False
 
     @classmethod
     async def verify_email_with_token(cls, session: AsyncSession, user_id: UUID, token: str) -> bool:
-        user = await cls.get_by_id(session, user_id)
+        # The token is not cached, so always load the user from the database here
+        result = await cls._execute_read(session, _USER_LOOKUPS["id"], {"id": user_id})
+        user = result.scalars().first() if result else None
         if user:
             if user.email_verified: 
                 return False
@@ -265,6 +599,7 @@ class UserService:
                 user.role = UserRole.AUTHENTICATED if user.role == UserRole.ANONYMOUS else user.role
                 session.add(user)
                 await session.commit()
+                await cls._invalidate_user_cache(user.id, user.email, user.nickname)
                 return True
         return False
 
@@ -273,12 +608,34 @@ class UserService:
         """
         Count the number of users in the database.
 
+        The count is cached in Redis for a few seconds. Once 80% of its lifetime has passed, the
+        first caller to take a short lock recomputes it while everyone else keeps getting the
+        cached value, so an expiring key never sends a burst of COUNT(*) queries to the database.
+
         :param session: The AsyncSession instance for database access.
         :return: The count of users.
         """
+        client = Cache.get_client()
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    cached, ttl = await pipe.get(_USER_COUNT_KEY).ttl(_USER_COUNT_KEY).execute()
+                if cached is not None:
+                    refresh_due = ttl < _USER_COUNT_CACHE_TTL * 0.2
+                    if not refresh_due or not await client.set(_USER_COUNT_LOCK_KEY, 1, nx=True, ex=5):
+                        return int(cached)
+            except RedisError as e:
+                logger.warning(f"Cache error: {e}")
+
         query = select(func.count()).select_from(User)
-        result = await session.execute(query)
-        count = result.scalar()
+        result = await cls._execute_read(session, query)
+        count = result.scalar() if result else 0
+
+        if client is not None and result:
+            try:
+                await client.set(_USER_COUNT_KEY, count, ex=_USER_COUNT_CACHE_TTL)
+            except RedisError as e:
+                logger.warning(f"Cache error: {e}")
         return count
     
     @classmethod
@@ -289,5 +646,7 @@ class UserService:
             user.failed_login_attempts = 0  # Optionally reset failed login attempts
             session.add(user)
             await session.commit()
+            await cls._invalidate_user_cache(user.id, user.email, user.nickname)
+            await cls._clear_failed_logins(user.id)
             return True
         return False
@@ -1,9 +1,11 @@
 from builtins import dict, int, max, str
-from typing import List, Callable
+from datetime import datetime
+from typing import List, Callable, Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
 from fastapi import Request
+from starlette.datastructures import URL
 from app.schemas.link_schema import Link
 from app.schemas.pagination_schema import PaginationLink
 
@@ -14,7 +16,8 @@ def create_link(rel: str, href: str, method: str = "GET", action: str = None) ->
 def create_pagination_link(rel: str, base_url: str, params: dict) -> PaginationLink:
     # Ensure parameters are added in a specific order
     query_string = f"skip={params['skip']}&limit={params['limit']}"
-    return PaginationLink(rel=rel, href=f"{base_url}?{query_string}")
+    separator = "&" if "?" in base_url else "?"
+    return PaginationLink(rel=rel, href=f"{base_url}{separator}{query_string}")
 
 def create_user_links(user_id: UUID, request: Request) -> List[Link]:
     """
@@ -31,7 +34,8 @@ def create_user_links(user_id: UUID, request: Request) -> List[Link]:
     ]
 
 def generate_pagination_links(request: Request, skip: int, limit: int, total_items: int) -> List[PaginationLink]:
-    base_url = str(request.url)
+    # Keep the request's filters but let each link set its own skip/limit
+    base_url = str(URL(str(request.url)).remove_query_params(["skip", "limit"]))
     total_pages = (total_items + limit - 1) // limit
     links = [
         create_pagination_link("self", base_url, {'skip': skip, 'limit': limit}),
@@ -46,3 +50,15 @@ def generate_pagination_links(request: Request, skip: int, limit: int, total_ite
         links.append(create_pagination_link("prev", base_url, {'skip': max(skip - limit, 0), 'limit': limit}))
 
     return links
+
+def generate_keyset_pagination_links(request: Request, next_after_created_at: Optional[datetime], next_after_id: Optional[UUID]) -> List[PaginationLink]:
+    """
+    Links for a keyset page. Offsets do not apply here, so the next link carries the cursor
+    of the page's last item and keeps the request's other query parameters.
+    """
+    url = URL(str(request.url))
+    links = [PaginationLink(rel="self", href=str(url))]
+    if next_after_id is not None:
+        next_url = url.include_query_params(after_created_at=next_after_created_at.isoformat(), after_id=str(next_after_id))
+        links.append(PaginationLink(rel="next", href=str(next_url)))
+    return links
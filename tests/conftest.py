@@ -9,6 +9,7 @@ Fixtures:
 - `db_session`: Handles database transactions to ensure a clean database state for each test.
 - User fixtures (`user`, `locked_user`, `verified_user`, etc.): Set up various user states to test different behaviors under diverse conditions.
 - `token`: Generates an authentication token for testing secured endpoints.
+- `cache_client`: Installs an in-memory stand-in for the Redis client used by the cache layer.
 - `initialize_database`: Prepares the database at the session start.
 - `setup_database`: Sets up and tears down the database before and after each test.
 """
@@ -30,6 +31,7 @@ from faker import Faker
 
 # Application-specific imports
 from app.main import app
+from app.cache import Cache
 from app.database import Base, Database
 from app.models.user_model import User, UserRole
 from app.dependencies import get_db, get_settings
@@ -47,6 +49,90 @@ AsyncTestingSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_c
 AsyncSessionScoped = scoped_session(AsyncTestingSessionLocal)
 
 
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client calls made by the cache layer."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = str(value)
+        if ex is None:
+            self.ttls.pop(key, None)
+        else:
+            self.ttls[key] = ex
+        return True
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if self.store.pop(key, None) is not None:
+                removed += 1
+            self.ttls.pop(key, None)
+        return removed
+
+    async def incr(self, key):
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def expire(self, key, seconds, nx=False):
+        if key not in self.store or (nx and key in self.ttls):
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    async def ttl(self, key):
+        if key not in self.store:
+            return -2
+        return self.ttls.get(key, -1)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute(), like a redis pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        results = [await method(*args, **kwargs) for method, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+@pytest.fixture
+def cache_client():
+    """Route the cache layer to an in-memory client for the duration of a test."""
+    client = FakeRedis()
+    Cache._client = client
+    yield client
+    Cache._client = None
+
+
 @pytest.fixture
 def email_service():
     # Assuming the TemplateManager does not need any arguments for initialization
@@ -55,6 +55,14 @@ async def test_update_user_email_access_allowed(async_client, admin_user, admin_
     assert response.status_code == 200
     assert response.json()["email"] == updated_data["email"]
 
+@pytest.mark.asyncio
+async def test_update_user_nickname_already_exists(async_client, admin_user, verified_user, admin_token):
+    updated_data = {"nickname": verified_user.nickname}
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = await async_client.put(f"/users/{admin_user.id}", json=updated_data, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Nickname already exists"
+
 
 @pytest.mark.asyncio
 async def test_delete_user(async_client, admin_user, admin_token):
@@ -76,6 +84,32 @@ async def test_create_user_duplicate_email(async_client, verified_user):
     assert response.status_code == 400
     assert "Email already exists" in response.json().get("detail", "")
 
+@pytest.mark.asyncio
+async def test_create_user_nickname_already_exists(async_client, verified_user, admin_token):
+    user_data = {
+        "nickname": verified_user.nickname,
+        "email": "new_admin_created@example.com",
+        "password": "sS#fdasrongPassword123!",
+        "role": UserRole.AUTHENTICATED.name
+    }
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = await async_client.post("/users/", json=user_data, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Nickname already exists"
+
+@pytest.mark.asyncio
+async def test_create_user_email_already_exists(async_client, verified_user, admin_token):
+    user_data = {
+        "nickname": generate_nickname(),
+        "email": verified_user.email,
+        "password": "sS#fdasrongPassword123!",
+        "role": UserRole.AUTHENTICATED.name
+    }
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = await async_client.post("/users/", json=user_data, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already exists"
+
 @pytest.mark.asyncio
 async def test_create_user_invalid_email(async_client):
     user_data = {
@@ -87,7 +121,7 @@ async def test_create_user_invalid_email(async_client):
 
 import pytest
 from app.services.jwt_service import decode_token
-from urllib.parse import urlencode
+from urllib.parse import parse_qs, urlencode, urlparse
 
 @pytest.mark.asyncio
 async def test_login_success(async_client, verified_user):
@@ -209,6 +243,41 @@ async def test_list_users_as_manager(async_client, manager_token):
     )
     assert response.status_code == 200
 
+@pytest.mark.asyncio
+async def test_list_users_keyset_pagination(async_client, admin_token, users_with_same_role_50_users):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first_page = (await async_client.get("/users/", params={"limit": 10}, headers=headers)).json()
+    assert first_page["page"] == 1
+    assert first_page["next_after_created_at"] and first_page["next_after_id"]
+
+    response = await async_client.get(
+        "/users/",
+        params={
+            "limit": 10,
+            "after_created_at": first_page["next_after_created_at"],
+            "after_id": first_page["next_after_id"],
+        },
+        headers=headers
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["page"] is None
+    assert len(second_page["items"]) == 10
+    first_ids = {item["id"] for item in first_page["items"]}
+    assert not first_ids & {item["id"] for item in second_page["items"]}
+    links = {link["rel"]: link["href"] for link in second_page["links"]}
+    assert "prev" not in links
+    assert f"after_id={second_page['next_after_id']}" in links["next"]
+
+@pytest.mark.asyncio
+async def test_list_users_keyset_requires_both_params(async_client, admin_user, admin_token):
+    response = await async_client.get(
+        "/users/",
+        params={"after_id": str(admin_user.id)},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == 422
+
 @pytest.mark.asyncio
 async def test_list_users_unauthorized(async_client, user_token):
     response = await async_client.get(
@@ -244,14 +313,43 @@ async def test_search_users_by_email(async_client: AsyncClient, db_session, admi
     assert len(response_data["items"]) == 1
     assert response_data["items"][0]["email"] == created_user.email
     assert response_data["items"][0]["nickname"] == created_user.nickname
+    assert response_data["items"][0]["created_at"] is not None
+    assert response_data["next_after_id"] is None  # a single result is the last page
 
 
+@pytest.mark.asyncio
+async def test_search_users_keyset_pagination(async_client, admin_token, users_with_same_role_50_users):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    params = {"role": "AUTHENTICATED", "limit": 10}
+    first_page = (await async_client.get("/users/search/", params=params, headers=headers)).json()
+    assert first_page["next_after_created_at"] and first_page["next_after_id"]
+    first_links = {link["rel"]: link["href"] for link in first_page["links"]}
+    assert parse_qs(urlparse(first_links["next"]).query) == {"role": ["AUTHENTICATED"], "skip": ["10"], "limit": ["10"]}
+
+    response = await async_client.get(
+        "/users/search/",
+        params={**params, "after_created_at": first_page["next_after_created_at"], "after_id": first_page["next_after_id"]},
+        headers=headers
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["page"] is None
+    assert len(second_page["items"]) == 10
+    assert all(item["role"] == "AUTHENTICATED" for item in second_page["items"])
+    first_ids = {item["id"] for item in first_page["items"]}
+    assert not first_ids & {item["id"] for item in second_page["items"]}
+
+    links = {link["rel"]: link["href"] for link in second_page["links"]}
+    assert "prev" not in links
+    next_page = (await async_client.get(links["next"], headers=headers)).json()
+    assert next_page["items"][0]["id"] not in {item["id"] for item in second_page["items"]}
+
 @pytest.mark.asyncio
 async def test_search_users_by_role(async_client: AsyncClient, db_session, admin_token, mock_email_service):
     """
     Test searching for users by their role.
     """
-    # Arrange: Create users with different roles
+    # Arrange: The admin_token fixture already stores this admin; add a user with another role
     admin_user = {
         "nickname": "admin_user",
         "email": "admin@example.com",
@@ -264,7 +362,6 @@ async def test_search_users_by_role(async_client: AsyncClient, db_session, admin
         "password": "SecurePassword123!",
         "role": "AUTHENTICATED"
     }
-    await UserService.create(db_session, admin_user, mock_email_service)
     await UserService.create(db_session, auth_user, mock_email_service)
 
     # Act: Search for users with the ADMIN role
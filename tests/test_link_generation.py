@@ -1,4 +1,5 @@
 from builtins import len, max, sorted, str
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 from urllib.parse import parse_qs, urlparse, parse_qsl, urlunparse, urlencode
 from uuid import uuid4
@@ -6,7 +7,7 @@ from uuid import uuid4
 import pytest
 from fastapi import Request
 
-from app.utils.link_generation import create_link, create_pagination_link, create_user_links, generate_pagination_links
+from app.utils.link_generation import create_link, create_pagination_link, create_user_links, generate_keyset_pagination_links, generate_pagination_links
 
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
 
@@ -49,3 +50,15 @@ def test_generate_pagination_links(mock_request):
     assert len(links) >= 4
     expected_self_url = "http://testserver/users?limit=5&skip=10"
     assert normalize_url(str(links[0].href)) == normalize_url(expected_self_url), "Self link should match expected URL"
+
+def test_generate_keyset_pagination_links(mock_request):
+    last_id = uuid4()
+    links = generate_keyset_pagination_links(mock_request, datetime(2024, 1, 1, tzinfo=timezone.utc), last_id)
+    assert [link.rel for link in links] == ["self", "next"]
+    next_params = parse_qs(urlparse(str(links[1].href)).query)
+    assert next_params["after_id"] == [str(last_id)]
+    assert next_params["after_created_at"] == ["2024-01-01T00:00:00+00:00"]
+
+def test_generate_keyset_pagination_links_last_page(mock_request):
+    links = generate_keyset_pagination_links(mock_request, None, None)
+    assert [link.rel for link in links] == ["self"]
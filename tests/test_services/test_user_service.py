@@ -1,9 +1,10 @@
 from builtins import range
+import json
 import pytest
 from sqlalchemy import select
 from app.dependencies import get_settings
 from app.models.user_model import User, UserRole
-from app.services.user_service import UserService
+from app.services.user_service import UserConflictError, UserService, _deserialize_user, _serialize_user
 from app.utils.nickname_gen import generate_nickname
 
 pytestmark = pytest.mark.asyncio
@@ -30,6 +31,26 @@ async def test_create_user_with_invalid_data(db_session, email_service):
     user = await UserService.create(db_session, user_data, email_service)
     assert user is None
 
+# Test creating a user whose nickname is already taken
+async def test_create_user_with_duplicate_nickname(db_session, user, email_service):
+    user_data = {
+        "nickname": user.nickname,
+        "email": "duplicate_nickname@example.com",
+        "password": "ValidPassword123!",
+        "role": UserRole.ADMIN.name
+    }
+    with pytest.raises(UserConflictError) as exc_info:
+        await UserService.create(db_session, user_data, email_service)
+    assert exc_info.value.field == "nickname"
+
+# Test detecting email and nickname conflicts in a single lookup
+async def test_find_conflicts(db_session, user):
+    email_taken, nickname_taken = await UserService.find_conflicts(db_session, email=user.email, nickname="free_nickname")
+    assert email_taken is True
+    assert nickname_taken is False
+    email_taken, nickname_taken = await UserService.find_conflicts(db_session, email=user.email, nickname=user.nickname, exclude_id=user.id)
+    assert (email_taken, nickname_taken) == (False, False)
+
 # Test fetching a user by ID when the user exists
 async def test_get_by_id_user_exists(db_session, user):
     retrieved_user = await UserService.get_by_id(db_session, user.id)
@@ -68,11 +89,25 @@ async def test_update_user_valid_data(db_session, user):
     assert updated_user is not None
     assert updated_user.email == new_email
 
+# Test updating a user to an email another user already has
+async def test_update_user_duplicate_email(db_session, user, verified_user):
+    with pytest.raises(UserConflictError) as exc_info:
+        await UserService.update(db_session, user.id, {"email": verified_user.email})
+    assert exc_info.value.field == "email"
+
 # Test updating a user with invalid data
 async def test_update_user_invalid_data(db_session, user):
     updated_user = await UserService.update(db_session, user.id, {"email": "invalidemail"})
     assert updated_user is None
 
+# Test that update returns the stored row and refreshes the instance already in the session
+async def test_update_user_returns_stored_values(db_session, user):
+    updated_user = await UserService.update(db_session, user.id, {"first_name": "Updated", "nickname": "updated_nickname"})
+    assert updated_user is not None
+    assert updated_user.first_name == "Updated"
+    assert updated_user.nickname == "updated_nickname"
+    assert user.first_name == "Updated"
+
 # Test deleting a user who exists
 async def test_delete_user_exists(db_session, user):
     deletion_success = await UserService.delete(db_session, user.id)
@@ -92,6 +127,14 @@ async def test_list_users_with_pagination(db_session, users_with_same_role_50_us
     assert len(users_page_2) == 10
     assert users_page_1[0].id != users_page_2[0].id
 
+# Test listing users with keyset pagination
+async def test_list_users_with_keyset_pagination(db_session, users_with_same_role_50_users):
+    users_page_1 = await UserService.list_users(db_session, limit=10)
+    last = users_page_1[-1]
+    users_page_2 = await UserService.list_users(db_session, limit=10, after=(last.created_at, last.id))
+    assert len(users_page_2) == 10
+    assert not {user.id for user in users_page_1} & {user.id for user in users_page_2}
+
 # Test registering a user with valid data
 async def test_register_user_with_valid_data(db_session, email_service):
     user_data = {
@@ -141,6 +184,26 @@ async def test_account_lock_after_failed_logins(db_session, verified_user):
     is_locked = await UserService.is_account_locked(db_session, verified_user.email)
     assert is_locked, "The account should be locked after the maximum number of failed login attempts."
 
+# Test that failed logins below the threshold are only counted in Redis
+async def test_failed_login_counted_in_redis(db_session, verified_user, cache_client):
+    user = await UserService.login_user(db_session, verified_user.email, "wrongpassword")
+    assert user is None
+    key = f"user:fail:{verified_user.id}"
+    assert cache_client.store[key] == "1"
+    assert cache_client.ttls[key] == get_settings().failed_login_window
+    result = await db_session.execute(select(User.failed_login_attempts, User.is_locked).where(User.id == verified_user.id))
+    assert tuple(result.one()) == (0, False)
+
+# Test that reaching the threshold in Redis locks the account in the database
+async def test_failed_logins_in_redis_lock_account(db_session, verified_user, cache_client):
+    max_login_attempts = get_settings().max_login_attempts
+    for _ in range(max_login_attempts):
+        await UserService.login_user(db_session, verified_user.email, "wrongpassword")
+
+    assert await UserService.is_account_locked(db_session, verified_user.email)
+    result = await db_session.execute(select(User.failed_login_attempts).where(User.id == verified_user.id))
+    assert result.scalar() == max_login_attempts
+
 # Test resetting a user's password
 async def test_reset_password(db_session, user):
     new_password = "NewPassword123!"
@@ -179,3 +242,117 @@ async def test_unlock_user_account(db_session, locked_user):
     assert unlocked, "The account should be unlocked"
     refreshed_user = await UserService.get_by_id(db_session, locked_user.id)
     assert not refreshed_user.is_locked, "The user should no longer be locked"
+
+# Test that a cached user payload restores the same column values
+async def test_user_cache_payload_round_trip(user):
+    restored = _deserialize_user(_serialize_user(user))
+    assert restored.id == user.id
+    assert restored.email == user.email
+    assert restored.role == user.role
+    assert restored.created_at == user.created_at
+
+# Test that the email verification token is never written to the cache
+async def test_user_cache_payload_excludes_verification_token(user):
+    user.verification_token = "secret_token"
+    assert "secret_token" not in _serialize_user(user)
+
+# Test that a cache hit is attached to the session without querying the database
+async def test_get_by_id_cache_hit_skips_database(db_session, user, cache_client, mocker):
+    await UserService.get_by_id(db_session, user.id)
+    assert UserService._user_cache_keys(email=user.email)[0] in cache_client.store
+    db_session.expunge_all()
+
+    mocker.patch.object(UserService, "_execute_read", side_effect=AssertionError("unexpected query"))
+    cached_user = await UserService.get_by_email(db_session, user.email)
+    assert cached_user.id == user.id
+    assert cached_user in db_session
+    assert not db_session.is_modified(cached_user)
+
+# Test that a corrupt cache entry is treated as a miss and removed
+async def test_get_by_id_discards_unreadable_cache_entry(db_session, user, cache_client):
+    key = UserService._user_cache_keys(user.id)[0]
+    cache_client.store[key] = "not json"
+    retrieved_user = await UserService.get_by_id(db_session, user.id)
+    assert retrieved_user.id == user.id
+    assert cache_client.store[key] != "not json"
+
+# Test that a payload written for a different set of columns is treated as a miss
+async def test_get_by_email_discards_outdated_cache_entry(db_session, user, cache_client):
+    key = UserService._user_cache_keys(email=user.email)[0]
+    payload = json.loads(_serialize_user(user))
+    payload["removed_column"] = "value"
+    cache_client.store[key] = json.dumps(payload)
+    retrieved_user = await UserService.get_by_email(db_session, user.email)
+    assert retrieved_user.id == user.id
+    assert "removed_column" not in cache_client.store[key]
+
+# Test that a cached entry is not returned for an email differing only in case
+async def test_get_by_email_cache_ignores_case_mismatch(db_session, user, cache_client):
+    await UserService.get_by_email(db_session, user.email)
+    assert await UserService.get_by_email(db_session, user.email.upper()) is None
+
+# Test that verifying an email works for a user that was loaded from the cache
+async def test_verify_email_with_token_after_cache_hit(db_session, user, cache_client):
+    user.verification_token = "valid_token_example"
+    await db_session.commit()
+    await UserService.get_by_id(db_session, user.id)
+    db_session.expunge_all()
+    await UserService.get_by_id(db_session, user.id)
+
+    assert await UserService.verify_email_with_token(db_session, user.id, "valid_token_example") is True
+
+# Test that renaming a user drops the cache entries for the old email and nickname
+async def test_update_user_invalidates_old_cache_keys(db_session, user, cache_client):
+    old_email, old_nickname = user.email, user.nickname
+    await UserService.get_by_id(db_session, user.id)
+    await UserService.update(db_session, user.id, {"email": "renamed@example.com", "nickname": "renamed_user"})
+
+    for key in UserService._user_cache_keys(user.id, old_email, old_nickname):
+        assert key not in cache_client.store
+    assert await UserService.get_by_email(db_session, old_email) is None
+
+# Test that deleting a user drops all of its cache entries
+async def test_delete_user_invalidates_cache_keys(db_session, user, cache_client):
+    await UserService.get_by_id(db_session, user.id)
+    assert await UserService.delete(db_session, user.id) is True
+    assert not [key for key in cache_client.store if key.startswith("user:")]
+
+# Test that a cached user count is returned without querying the database
+async def test_count_cache_hit_skips_database(db_session, user, cache_client, mocker):
+    assert await UserService.count(db_session) == 1
+    assert cache_client.store["stats:users:count"] == "1"
+
+    mocker.patch.object(UserService, "_execute_read", side_effect=AssertionError("unexpected query"))
+    assert await UserService.count(db_session) == 1
+
+# Test that a due refresh keeps serving the cached count while another caller holds the lock
+async def test_count_refresh_lock_held_returns_cached_value(db_session, cache_client, mocker):
+    await cache_client.set("stats:users:count", 42, ex=1)
+    await cache_client.set("stats:users:count:lock", 1, ex=5)
+
+    mocker.patch.object(UserService, "_execute_read", side_effect=AssertionError("unexpected query"))
+    assert await UserService.count(db_session) == 42
+
+# Test that the caller winning the refresh lock recomputes and re-caches the count
+async def test_count_refresh_lock_won_recomputes(db_session, user, cache_client):
+    await cache_client.set("stats:users:count", 42, ex=1)
+
+    assert await UserService.count(db_session) == 1
+    assert cache_client.store["stats:users:count"] == "1"
+    assert cache_client.ttls["stats:users:count"] == get_settings().user_count_cache_ttl
+    assert "stats:users:count:lock" in cache_client.store
+
+# Test that creating and deleting users drops the cached count
+async def test_create_and_delete_invalidate_count_cache(db_session, email_service, cache_client):
+    await UserService.count(db_session)
+    user = await UserService.create(db_session, {
+        "nickname": generate_nickname(),
+        "email": "counted_user@example.com",
+        "password": "ValidPassword123!",
+        "role": UserRole.AUTHENTICATED.name
+    }, email_service)
+    assert "stats:users:count" not in cache_client.store
+
+    assert await UserService.count(db_session) == 1
+    assert await UserService.delete(db_session, user.id) is True
+    assert "stats:users:count" not in cache_client.store